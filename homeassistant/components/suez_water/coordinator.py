@@ -0,0 +1,103 @@
+"""Suez water update coordinator."""
+
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+from typing import Any
+
+from pysuez import SuezClient
+from pysuez.client import PySuezError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import CONF_COUNTER_ID, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+type SuezWaterConfigEntry = ConfigEntry[SuezWaterCoordinator]
+
+
+@dataclass
+class SuezWaterData:
+    """Hold the aggregated data fetched from the suez api."""
+
+    aggregated_value: float
+    aggregated_attributes: dict[str, Any]
+
+
+class SuezWaterCoordinator(DataUpdateCoordinator[SuezWaterData]):
+    """Suez water coordinator."""
+
+    config_entry: SuezWaterConfigEntry
+    _client: SuezClient
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize suez water coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(hours=12),
+            always_update=False,
+        )
+        self.attribution: str | None = None
+
+    async def _async_setup(self) -> None:
+        """Create the client used to fetch data."""
+        self._client = await self.hass.async_add_executor_job(self._get_client)
+
+    def _get_client(self) -> SuezClient:
+        """Create and authenticate the suez client.
+
+        Blocking, runs in the executor.
+        """
+        try:
+            client = SuezClient(
+                self.config_entry.data[CONF_USERNAME],
+                self.config_entry.data[CONF_PASSWORD],
+                self.config_entry.data[CONF_COUNTER_ID],
+                provider=None,
+            )
+            if not client.check_credentials():
+                raise ConfigEntryError("Invalid credentials for suez water")
+        except PySuezError as err:
+            raise UpdateFailed("Unable to connect to the suez api") from err
+        return client
+
+    async def _async_update_data(self) -> SuezWaterData:
+        """Fetch data from the suez water api."""
+        try:
+            data = await self.hass.async_add_executor_job(self._fetch_aggregated_data)
+        except PySuezError as err:
+            raise UpdateFailed("Suez data update failed") from err
+        _LOGGER.debug("Successfully fetched suez data")
+        return data
+
+    def _fetch_aggregated_data(self) -> SuezWaterData:
+        """Fetch the last day consumption and aggregated statistics.
+
+        Blocking, runs in the executor.
+        """
+        self._client.update()
+        attributes = self._client.attributes
+        if self.attribution is None:
+            # The attribution message is constant for the integration lifetime
+            self.attribution = attributes["attribution"]
+        return SuezWaterData(
+            # state holds the volume of consumed water during previous day
+            aggregated_value=self._client.state,
+            aggregated_attributes={
+                "this_month_consumption": dict(attributes["thisMonthConsumption"]),
+                "previous_month_consumption": dict(
+                    attributes["previousMonthConsumption"]
+                ),
+                "highest_monthly_consumption": attributes["highestMonthlyConsumption"],
+                "last_year_overall": attributes["lastYearOverAll"],
+                "this_year_overall": attributes["thisYearOverAll"],
+                "history": dict(attributes["history"]),
+            },
+        )